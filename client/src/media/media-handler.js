@@ -14,6 +14,10 @@
  * limitations under the License.
  */
 
+// Longest edge (in pixels) of the frames sent to Gemini
+const MAX_FRAME_DIMENSION = 768;
+const JPEG_QUALITY = 0.75;
+
 export class MediaHandler {
   constructor() {
     this.videoElement = null;
@@ -111,13 +115,18 @@ export class MediaHandler {
       
       const canvas = document.createElement('canvas');
       const context = canvas.getContext('2d');
-      canvas.width = this.videoElement.videoWidth;
-      canvas.height = this.videoElement.videoHeight;
+      const { videoWidth, videoHeight } = this.videoElement;
+      if (!videoWidth || !videoHeight) return;
+
+      // Downscale so the longest edge is at most MAX_FRAME_DIMENSION
+      const scale = Math.min(1, MAX_FRAME_DIMENSION / Math.max(videoWidth, videoHeight));
+      canvas.width = Math.round(videoWidth * scale);
+      canvas.height = Math.round(videoHeight * scale);
       
       context.drawImage(this.videoElement, 0, 0, canvas.width, canvas.height);
       
       // Convert to JPEG and base64 encode
-      const base64Image = canvas.toDataURL('image/jpeg', 0.8).split(',')[1];
+      const base64Image = canvas.toDataURL('image/jpeg', JPEG_QUALITY).split(',')[1];
       this.frameCallback(base64Image);
     };
 
@@ -17,7 +17,9 @@ Configuration for Vertex AI Gemini Multimodal Live Proxy Server
 """
 
 import os
+import asyncio
 import logging
+from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 from google.cloud import secretmanager
@@ -56,28 +58,50 @@ class ApiConfig:
         self.use_vertex = os.getenv('VERTEX_API', 'false').lower() == 'true'
         
         self.api_key: Optional[str] = None
+        self.weather_api_key: Optional[str] = None
+        
+        # Credentials are fetched once and shared by all sessions
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
         
         logger.info(f"Initialized API configuration with Vertex AI: {self.use_vertex}")
     
-    async def initialize(self):
-        """Initialize API credentials."""
+    async def _load_weather_api_key(self):
+        """Load the OpenWeather API key."""
         try:
-            # Always try to get OpenWeather API key regardless of endpoint
-            self.weather_api_key = get_secret('OPENWEATHER_API_KEY')
+            # Secret Manager calls are blocking, keep them off the event loop
+            self.weather_api_key = await asyncio.to_thread(get_secret, 'OPENWEATHER_API_KEY')
         except Exception as e:
             logger.warning(f"Failed to get OpenWeather API key from Secret Manager: {e}")
             self.weather_api_key = os.getenv('OPENWEATHER_API_KEY')
             if not self.weather_api_key:
                 raise ConfigurationError("OpenWeather API key not available")
 
-        if not self.use_vertex:
-            try:
-                self.api_key = get_secret('GOOGLE_API_KEY')
-            except Exception as e:
-                logger.warning(f"Failed to get API key from Secret Manager: {e}")
-                self.api_key = os.getenv('GOOGLE_API_KEY')
-                if not self.api_key:
-                    raise ConfigurationError("No API key available from Secret Manager or environment")
+    async def _load_api_key(self):
+        """Load the Google API key for the development endpoint."""
+        try:
+            self.api_key = await asyncio.to_thread(get_secret, 'GOOGLE_API_KEY')
+        except Exception as e:
+            logger.warning(f"Failed to get API key from Secret Manager: {e}")
+            self.api_key = os.getenv('GOOGLE_API_KEY')
+            if not self.api_key:
+                raise ConfigurationError("No API key available from Secret Manager or environment")
+
+    async def initialize(self):
+        """Initialize API credentials."""
+        async with self._init_lock:
+            if self._initialized:
+                return
+            
+            # Always get OpenWeather API key regardless of endpoint
+            loaders = [self._load_weather_api_key()]
+            if not self.use_vertex:
+                loaders.append(self._load_api_key())
+            
+            # The secrets are independent, so fetch them concurrently
+            await asyncio.gather(*loaders)
+            
+            self._initialized = True
 
 # Initialize API configuration
 api_config = ApiConfig()
@@ -106,10 +130,10 @@ for name, url in CLOUD_FUNCTIONS.items():
         logger.warning(f"Invalid URL format for {name}: {url}")
 
 # Load system instructions
+SYSTEM_INSTRUCTIONS_PATH = Path(__file__).parent / 'system-instructions.txt'
 try:
-    with open('config/system-instructions.txt', 'r') as f:
-        SYSTEM_INSTRUCTIONS = f.read()
-except Exception as e:
+    SYSTEM_INSTRUCTIONS = SYSTEM_INSTRUCTIONS_PATH.read_text()
+except OSError as e:
     logger.error(f"Failed to load system instructions: {e}")
     SYSTEM_INSTRUCTIONS = ""
 
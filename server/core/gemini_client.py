@@ -18,45 +18,59 @@ Gemini client initialization and connection management
 
 import logging
 import os
+from typing import Optional
 from google import genai
 from config.config import MODEL, CONFIG, api_config, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Shared client, created on first use and reused by every session
+_GENAI_CLIENT: Optional[genai.Client] = None
+
+def get_genai_client() -> genai.Client:
+    """Return the shared Gemini client, creating it on first use"""
+    global _GENAI_CLIENT
+    if _GENAI_CLIENT is not None:
+        return _GENAI_CLIENT
+
+    if api_config.use_vertex:
+        # Vertex AI configuration
+        location = os.getenv('VERTEX_LOCATION', 'us-central1')
+        project_id = os.environ.get('PROJECT_ID')
+        
+        if not project_id:
+            raise ConfigurationError("PROJECT_ID is required for Vertex AI")
+        
+        logger.info(f"Initializing Vertex AI client with location: {location}, project: {project_id}")
+        
+        # Initialize Vertex AI client
+        _GENAI_CLIENT = genai.Client(
+            vertexai=True,
+            location=location,
+            project=project_id,
+            # http_options={'api_version': 'v1beta'}
+        )
+        logger.info(f"Vertex AI client initialized with client: {_GENAI_CLIENT}")
+    else:
+        # Development endpoint configuration
+        logger.info("Initializing development endpoint client")
+        
+        # Initialize development client
+        _GENAI_CLIENT = genai.Client(
+            vertexai=False,
+            http_options={'api_version': 'v1alpha'},
+            api_key=api_config.api_key
+        )
+
+    return _GENAI_CLIENT
+
 async def create_gemini_session():
     """Create and initialize the Gemini client and session"""
     try:
         # Initialize authentication
         await api_config.initialize()
         
-        if api_config.use_vertex:
-            # Vertex AI configuration
-            location = os.getenv('VERTEX_LOCATION', 'us-central1')
-            project_id = os.environ.get('PROJECT_ID')
-            
-            if not project_id:
-                raise ConfigurationError("PROJECT_ID is required for Vertex AI")
-            
-            logger.info(f"Initializing Vertex AI client with location: {location}, project: {project_id}")
-            
-            # Initialize Vertex AI client
-            client = genai.Client(
-                vertexai=True,
-                location=location,
-                project=project_id,
-                # http_options={'api_version': 'v1beta'}
-            )
-            logger.info(f"Vertex AI client initialized with client: {client}")
-        else:
-            # Development endpoint configuration
-            logger.info("Initializing development endpoint client")
-            
-            # Initialize development client
-            client = genai.Client(
-                vertexai=False,
-                http_options={'api_version': 'v1alpha'},
-                api_key=api_config.api_key
-            )
+        client = get_genai_client()
                 
         # Create the session
         session = client.aio.live.connect(
@@ -71,4 +85,4 @@ async def create_gemini_session():
         raise
     except Exception as e:
         logger.error(f"Unexpected error while creating Gemini session: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
\ No newline at end of file
@@ -16,7 +16,7 @@
 Session management for Gemini Multimodal Live Proxy Server
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 import asyncio
 
@@ -29,6 +29,7 @@ class SessionState:
     current_audio_stream: Optional[Any] = None
     genai_session: Optional[Any] = None
     received_model_response: bool = False  # Track if we've received a model response in current turn
+    audio_buffer: bytearray = field(default_factory=bytearray)  # Gemini audio not yet sent to the client
 
 # Global session storage
 active_sessions: Dict[str, SessionState] = {}
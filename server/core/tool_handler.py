@@ -18,12 +18,27 @@ Tool execution and handling for Gemini Multimodal Live Proxy Server
 
 import logging
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from config.config import CLOUD_FUNCTIONS
 from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so connections to the cloud functions are pooled
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession()
+    return _HTTP_SESSION
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session"""
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+
 async def execute_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a tool based on name and parameters by calling the corresponding cloud function"""
     try:
@@ -39,22 +54,23 @@ async def execute_tool(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]
         logger.debug(f"Calling cloud function for {tool_name}")
         logger.debug(f"URL with params: {function_url}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(function_url) as response:
-                response_text = await response.text()
+        session = get_http_session()
+        async with session.get(function_url) as response:
+            response_text = await response.text()
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Response status: {response.status}")
                 logger.debug(f"Response headers: {dict(response.headers)}")
                 logger.debug(f"Response body: {response_text}")
-                
-                if response.status != 200:
-                    logger.error(f"Cloud function error: {response_text}")
-                    return {"error": f"Cloud function returned status {response.status}"}
-                
-                try:
-                    return await response.json()
-                except Exception as e:
-                    logger.error(f"Failed to parse JSON response: {response_text}")
-                    return {"error": f"Invalid JSON response from cloud function: {str(e)}"}
+            
+            if response.status != 200:
+                logger.error(f"Cloud function error: {response_text}")
+                return {"error": f"Cloud function returned status {response.status}"}
+            
+            try:
+                return await response.json()
+            except Exception as e:
+                logger.error(f"Failed to parse JSON response: {response_text}")
+                return {"error": f"Invalid JSON response from cloud function: {str(e)}"}
 
     except aiohttp.ClientError as e:
         logger.error(f"Network error calling cloud function for {tool_name}: {str(e)}")
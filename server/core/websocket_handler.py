@@ -18,9 +18,9 @@ WebSocket message handling for Gemini Multimodal Live Proxy Server
 
 import logging
 import json
+import orjson
 import asyncio
-import base64
-import traceback
+import pybase64
 from typing import Any, Optional
 from google.genai import types
 
@@ -30,16 +30,45 @@ from core.gemini_client import create_gemini_session
 
 logger = logging.getLogger(__name__)
 
+# Gemini streams 24kHz 16-bit mono PCM; forward it to the client in ~80ms frames
+AUDIO_FLUSH_BYTES = 24000 * 2 * 80 // 1000
+
+# Audio messages are built around the base64 payload without re-serializing it
+AUDIO_MESSAGE_PREFIX = b'{"type":"audio","data":"'
+AUDIO_MESSAGE_SUFFIX = b'"}'
+
+# Messages with fixed content, serialized once
+READY_MESSAGE = orjson.dumps({"ready": True})
+TURN_COMPLETE_MESSAGE = orjson.dumps({"type": "turn_complete"})
+INTERRUPTED_MESSAGE = orjson.dumps({
+    "type": "interrupted",
+    "data": {
+        "message": "Response interrupted by user input"
+    }
+})
+
 async def send_error_message(websocket: Any, error_data: dict) -> None:
     """Send formatted error message to client."""
     try:
-        await websocket.send(json.dumps({
+        await websocket.send(orjson.dumps({
             "type": "error",
             "data": error_data
-        }))
+        }), text=True)
     except Exception as e:
         logger.error(f"Failed to send error message: {e}")
 
+async def send_audio_message(websocket: Any, audio_data: bytes) -> None:
+    """Send PCM audio to client as a base64 encoded message."""
+    # Base64 output never needs JSON escaping, so splice it in directly
+    message = b"".join((AUDIO_MESSAGE_PREFIX, pybase64.b64encode(audio_data), AUDIO_MESSAGE_SUFFIX))
+    await websocket.send(message, text=True)
+
+async def flush_audio_buffer(websocket: Any, session: SessionState) -> None:
+    """Send any audio buffered for the current turn to the client."""
+    if session.audio_buffer:
+        await send_audio_message(websocket, session.audio_buffer)
+        session.audio_buffer.clear()
+
 async def cleanup_session(session: Optional[SessionState], session_id: str) -> None:
     """Clean up session resources."""
     try:
@@ -89,10 +118,10 @@ async def handle_messages(websocket: Any, session: SessionState) -> None:
                         "error_type": "quota_exceeded"
                     })
                     # Send text message to show in chat
-                    await websocket.send(json.dumps({
+                    await websocket.send(orjson.dumps({
                         "type": "text",
                         "data": "⚠️ Quota exceeded. Please wait a moment and try again in a few minutes."
-                    }))
+                    }), text=True)
                     handled = True
                     break
                 except Exception as send_err:
@@ -104,8 +133,7 @@ async def handle_messages(websocket: Any, session: SessionState) -> None:
         
         if not handled:
             # For other errors, log and re-raise
-            logger.error(f"Error in message handling: {eg}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.error(f"Error in message handling: {eg}", exc_info=True)
             raise
     finally:
         # Cancel tasks if they're still running
@@ -128,52 +156,42 @@ async def handle_client_messages(websocket: Any, session: SessionState) -> None:
     try:
         async for message in websocket:
             try:
-                data = json.loads(message)
-                
-                if "type" in data:
-                    msg_type = data["type"]
-                    if msg_type == "audio":
-                        logger.debug("Client -> Gemini: Sending audio data...")
-                    elif msg_type == "image":
-                        logger.debug("Client -> Gemini: Sending image data...")
-                    else:
-                        # Replace audio data with placeholder in debug output
-                        debug_data = data.copy()
-                        if "data" in debug_data and debug_data["type"] == "audio":
-                            debug_data["data"] = "<audio data>"
-                        logger.debug(f"Client -> Gemini: {json.dumps(debug_data, indent=2)}")
+                data = orjson.loads(message)
+                msg_type = data.get("type")
+                if msg_type is None:
+                    continue
                 
-                # Handle different types of input
-                if "type" in data:
-                    if data["type"] == "audio":
-                        logger.debug("Sending audio to Gemini...")
-                        await session.genai_session.send(input={
-                            "data": data.get("data"),
-                            "mime_type": "audio/pcm"
-                        }, end_of_turn=True)
-                        logger.debug("Audio sent to Gemini")
-                    elif data["type"] == "image":
-                        logger.info("Sending image to Gemini...")
-                        await session.genai_session.send(input={
-                            "data": data.get("data"),
-                            "mime_type": "image/jpeg"
-                        })
-                        logger.info("Image sent to Gemini")
-                    elif data["type"] == "text":
+                # Handle different types of input, most frequent first
+                if msg_type == "audio":
+                    logger.debug("Client -> Gemini: Sending audio data...")
+                    await session.genai_session.send(input={
+                        "data": data.get("data"),
+                        "mime_type": "audio/pcm"
+                    }, end_of_turn=True)
+                    logger.debug("Audio sent to Gemini")
+                elif msg_type == "image":
+                    logger.debug("Client -> Gemini: Sending image data...")
+                    await session.genai_session.send(input={
+                        "data": data.get("data"),
+                        "mime_type": "image/jpeg"
+                    })
+                    logger.debug("Image sent to Gemini")
+                else:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Client -> Gemini: %s", json.dumps(data, indent=2))
+                    if msg_type == "text":
                         logger.info("Sending text to Gemini...")
                         await session.genai_session.send(input=data.get("data"), end_of_turn=True)
                         logger.info("Text sent to Gemini")
-                    elif data["type"] == "end":
+                    elif msg_type == "end":
                         logger.info("Received end signal")
                     else:
-                        logger.warning(f"Unsupported message type: {data.get('type')}")
+                        logger.warning("Unsupported message type: %s", msg_type)
             except Exception as e:
-                logger.error(f"Error handling client message: {e}")
-                logger.error(f"Full traceback:\n{traceback.format_exc()}")
+                logger.error(f"Error handling client message: {e}", exc_info=True)
     except Exception as e:
         if "connection closed" not in str(e).lower():  # Don't log normal connection closes
-            logger.error(f"WebSocket connection error: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.error(f"WebSocket connection error: {e}", exc_info=True)
         raise  # Re-raise to let the parent handle cleanup
 
 async def handle_gemini_responses(websocket: Any, session: SessionState) -> None:
@@ -187,14 +205,17 @@ async def handle_gemini_responses(websocket: Any, session: SessionState) -> None
         while True:
             async for response in session.genai_session.receive():
                 try:
-                    # Replace audio data with placeholder in debug output
-                    debug_response = str(response)
-                    if 'data=' in debug_response and 'mime_type=\'audio/pcm' in debug_response:
-                        debug_response = debug_response.split('data=')[0] + 'data=<audio data>' + debug_response.split('mime_type=')[1]
-                    logger.debug(f"Received response from Gemini: {debug_response}")
+                    # Rendering the response is costly, only do it when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        # Replace audio data with placeholder in debug output
+                        debug_response = str(response)
+                        if 'data=' in debug_response and 'mime_type=\'audio/pcm' in debug_response:
+                            debug_response = debug_response.split('data=')[0] + 'data=<audio data>' + debug_response.split('mime_type=')[1]
+                        logger.debug("Received response from Gemini: %s", debug_response)
                     
                     # If there's a tool call, add it to the queue and continue
                     if response.tool_call:
+                        await flush_audio_buffer(websocket, session)
                         await tool_queue.put(response.tool_call)
                         continue  # Continue processing other responses while tool executes
                     
@@ -202,8 +223,7 @@ async def handle_gemini_responses(websocket: Any, session: SessionState) -> None
                     await process_server_content(websocket, session, response.server_content)
                     
                 except Exception as e:
-                    logger.error(f"Error handling Gemini response: {e}")
-                    logger.error(f"Full traceback:\n{traceback.format_exc()}")
+                    logger.error(f"Error handling Gemini response: {e}", exc_info=True)
     finally:
         # Cancel and clean up tool processor
         if tool_processor and not tool_processor.done():
@@ -221,42 +241,46 @@ async def handle_gemini_responses(websocket: Any, session: SessionState) -> None
             except asyncio.QueueEmpty:
                 break
 
+async def execute_function_call(websocket: Any, function_call: Any) -> types.FunctionResponse:
+    """Execute a single function call, mirroring its progress to the client."""
+    # Send function call to client (for UI feedback)
+    await websocket.send(orjson.dumps({
+        "type": "function_call",
+        "data": {
+            "name": function_call.name,
+            "args": function_call.args
+        }
+    }), text=True)
+    
+    tool_result = await execute_tool(function_call.name, function_call.args)
+    
+    # Send function response to client
+    await websocket.send(orjson.dumps({
+        "type": "function_response",
+        "data": tool_result
+    }), text=True)
+    
+    return types.FunctionResponse(
+        name=function_call.name,
+        id=function_call.id,
+        response=tool_result
+    )
+
 async def process_tool_queue(queue: asyncio.Queue, websocket: Any, session: SessionState):
     """Process tool calls from the queue."""
     while True:
         tool_call = await queue.get()
         try:
-            function_responses = []
-            for function_call in tool_call.function_calls:
-                # Store the tool execution in session state
-                session.current_tool_execution = asyncio.current_task()
-                
-                # Send function call to client (for UI feedback)
-                await websocket.send(json.dumps({
-                    "type": "function_call",
-                    "data": {
-                        "name": function_call.name,
-                        "args": function_call.args
-                    }
-                }))
-                
-                tool_result = await execute_tool(function_call.name, function_call.args)
-                
-                # Send function response to client
-                await websocket.send(json.dumps({
-                    "type": "function_response",
-                    "data": tool_result
-                }))
-                
-                function_responses.append(
-                    types.FunctionResponse(
-                        name=function_call.name,
-                        id=function_call.id,
-                        response=tool_result
-                    )
-                )
-                
-                session.current_tool_execution = None
+            # Store the tool execution in session state
+            session.current_tool_execution = asyncio.current_task()
+            
+            # Function calls are independent, so run them concurrently
+            function_responses = await asyncio.gather(*(
+                execute_function_call(websocket, function_call)
+                for function_call in tool_call.function_calls
+            ))
+            
+            session.current_tool_execution = None
             
             if function_responses:
                 tool_response = types.LiveClientToolResponse(
@@ -273,13 +297,10 @@ async def process_server_content(websocket: Any, session: SessionState, server_c
     # Check for interruption first
     if hasattr(server_content, 'interrupted') and server_content.interrupted:
         logger.info("Interruption detected from Gemini")
-        await websocket.send(json.dumps({
-            "type": "interrupted",
-            "data": {
-                "message": "Response interrupted by user input"
-            }
-        }))
+        await websocket.send(INTERRUPTED_MESSAGE, text=True)
         session.is_receiving_response = False
+        # Drop audio the client should no longer play
+        session.audio_buffer.clear()
         return
 
     if server_content.model_turn:
@@ -287,21 +308,20 @@ async def process_server_content(websocket: Any, session: SessionState, server_c
         session.is_receiving_response = True
         for part in server_content.model_turn.parts:
             if part.inline_data:
-                audio_base64 = base64.b64encode(part.inline_data.data).decode('utf-8')
-                await websocket.send(json.dumps({
-                    "type": "audio",
-                    "data": audio_base64
-                }))
+                # Coalesce small audio chunks so they go out as fewer, larger frames
+                session.audio_buffer += part.inline_data.data
+                if len(session.audio_buffer) >= AUDIO_FLUSH_BYTES:
+                    await flush_audio_buffer(websocket, session)
             elif part.text:
-                await websocket.send(json.dumps({
+                await flush_audio_buffer(websocket, session)
+                await websocket.send(orjson.dumps({
                     "type": "text",
                     "data": part.text
-                }))
+                }), text=True)
     
     if server_content.turn_complete:
-        await websocket.send(json.dumps({
-            "type": "turn_complete"
-        }))
+        await flush_audio_buffer(websocket, session)
+        await websocket.send(TURN_COMPLETE_MESSAGE, text=True)
         session.received_model_response = False
         session.is_receiving_response = False
 
@@ -316,7 +336,7 @@ async def handle_client(websocket: Any) -> None:
             session.genai_session = gemini_session
             
             # Send ready message to client
-            await websocket.send(json.dumps({"ready": True}))
+            await websocket.send(READY_MESSAGE, text=True)
             logger.info(f"New session started: {session_id}")
             
             try:
@@ -341,8 +361,7 @@ async def handle_client(websocket: Any) -> None:
             "error_type": "timeout"
         })
     except Exception as e:
-        logger.error(f"Error in handle_client: {e}")
-        logger.error(f"Full traceback:\n{traceback.format_exc()}")
+        logger.error(f"Error in handle_client: {e}", exc_info=True)
         
         if "connection closed" in str(e).lower() or "websocket" in str(e).lower():
             logger.info(f"WebSocket connection closed for session {session_id}")
@@ -22,6 +22,12 @@ import os
 import websockets
 
 from core.websocket_handler import handle_client
+from core.tool_handler import close_http_session
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -57,9 +63,18 @@ async def main() -> None:
         port,
         ping_interval=30,
         ping_timeout=10,
+        # Frames carry base64 media, which deflate cannot shrink
+        compression=None,
+        max_size=16 * 1024 * 1024,
+        write_limit=1 << 20,
     ):
         logger.info(f"Running websocket server on 0.0.0.0:{port}...")
-        await asyncio.Future()  # run forever
+        try:
+            await asyncio.Future()  # run forever
+        finally:
+            await close_http_session()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file